@@ -0,0 +1,101 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+from pipelines_push_action.yaml_utils import (
+    get_pipeline_changed_fields,
+    get_pipeline_unset_fields,
+    load_yaml_file,
+    load_yaml_file_at_ref,
+    map_yaml_to_files,
+)
+
+log = logging.getLogger(__name__)
+
+
+def get_pipelines_to_change(
+    files_deleted: list[Path],
+    files_changed: list[Path],
+    pipelines_dir: Path,
+    base_ref: Optional[str] = None,
+) -> dict:
+    """Returns a dictionary of changes that will be applied
+
+    Pipelines to update carry the set of fields that changed. They are
+    computed by diffing the pipeline YAML against its version at
+    `base_ref`, and from the linked `.py` and `requirements.txt` files that
+    changed. Without `base_ref`, a YAML change updates all the fields.
+    """
+    pipeline_2_files = map_yaml_to_files(pipelines_dir)
+
+    # Map each changed pipeline to the files that triggered the change
+    pipelines_changed = {}
+    for file in files_changed:
+        if file.suffix in [".yaml", ".yml"]:
+            pipelines_changed.setdefault(file, set()).add(file)
+        elif file.suffix == ".py" or file.name == "requirements.txt":
+            for k in pipeline_2_files:
+                if file in pipeline_2_files[k]:
+                    pipelines_changed.setdefault(k, set()).add(file)
+        else:
+            continue
+
+    to_create = []
+    to_update = []
+    spaces_to_create = []
+    for file, triggers in pipelines_changed.items():
+        p = load_yaml_file(file)
+        if p.pipeline_id is not None:
+            fields = set()
+            unset_fields = get_pipeline_unset_fields(p)
+            for trigger in triggers:
+                if trigger == file:
+                    old = load_yaml_file_at_ref(file, base_ref) if base_ref else None
+                    yaml_fields = get_pipeline_changed_fields(old, p)
+                    if old is not None:
+                        cleared = yaml_fields & unset_fields
+                        cleared -= get_pipeline_unset_fields(old)
+                        if cleared:
+                            log.warning(
+                                f"Fields {', '.join(sorted(cleared))} were removed "
+                                f"from pipeline {p.pipeline_id}. Clearing them is "
+                                f"not supported, they will not be updated."
+                            )
+                    fields |= yaml_fields
+                elif trigger.suffix == ".py":
+                    fields.add("transformation_file")
+                else:
+                    fields.add("requirements")
+
+            # Unset fields are read as "keep the current value" by GlassFlow SDK
+            fields -= unset_fields
+
+            if not fields:
+                log.info(f"No changes to apply on pipeline {p.pipeline_id}")
+                continue
+            to_update.append({"file": file, "pipeline": p, "fields": fields})
+        else:
+            to_create.append({"file": file, "pipeline": p})
+
+        if p.space_id is None:
+            spaces_to_create.append({"file": file, "name": p.space_name})
+
+    to_delete = []
+    for file in files_deleted:
+        if file.suffix not in [".yaml", ".yml"]:
+            continue
+
+        try:
+            p = load_yaml_file(file)
+            to_delete.append({"file": file, "pipeline": p})
+        except Exception as e:
+            log.error(e)
+        finally:
+            file.unlink()
+
+    return {
+        "to_create": to_create,
+        "to_update": to_update,
+        "to_delete": to_delete,
+        "spaces_to_create": spaces_to_create,
+    }
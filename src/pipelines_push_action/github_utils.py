@@ -1,8 +1,29 @@
 import os
+import subprocess
+from pathlib import Path
+from typing import Optional
 
 
 def set_outputs(outputs: dict):
     """Write outputs to GITHUB_OUTPUT environment variable"""
     for k, v in outputs.items():
         with open(os.environ["GITHUB_OUTPUT"], 'a') as fh:
-            fh.write(f"{k}={v}\n")
\ No newline at end of file
+            fh.write(f"{k}={v}\n")
+
+
+def get_file_at_ref(path: Path, ref: str) -> Optional[str]:
+    """Returns the content of a file at a given git ref, None if not found"""
+    # `./` is resolved by git relative to the working directory of the command
+    try:
+        result = subprocess.run(
+            ["git", "show", f"{ref}:./{path.name}"],
+            cwd=path.parent,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        # git is not installed or the directory does not exist
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
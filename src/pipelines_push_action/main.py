@@ -2,13 +2,14 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
 from glassflow import GlassFlowClient
 
+from pipelines_push_action.changes import get_pipelines_to_change
 from pipelines_push_action.github_utils import set_outputs
+from pipelines_push_action.profiling import profile_local_phases
 from pipelines_push_action.yaml_utils import (
-    load_yaml_file,
-    map_yaml_to_files,
     yaml_file_to_pipeline,
     update_pipeline_id_in_yaml,
     update_space_id_in_yaml
@@ -35,6 +36,11 @@ Expected changes on your GlassFlow pipelines:
 \t‣ Update {to_update} pipelines {"" if to_update == 0 else f'(IDs: {to_update_ids})'}
 \t‣ Delete {to_delete} pipelines {"" if to_update == 0 else f'(IDs: {to_delete_ids})'}
     """
+    if to_update > 0:
+        message += "\nFields to update per pipeline:"
+        for p in changes["to_update"]:
+            message += (f"\n\t‣ {p['pipeline'].pipeline_id}: "
+                        f"{', '.join(sorted(p['fields']))}")
     spaces_to_create_count = len(changes["spaces_to_create"])
     if spaces_to_create_count > 0:
         spaces_to_create_names = [s["name"] for s in changes["spaces_to_create"]]
@@ -80,19 +86,14 @@ def update_pipelines(to_update, client: GlassFlowClient) -> None:
             personal_access_token=client.personal_access_token
         )
 
+        # Only send the fields that changed, the others are left untouched
+        fields = sorted(change["fields"])
         existing_pipeline = client.get_pipeline(gf_pipeline.id)
         existing_pipeline.update(
-            name=gf_pipeline.name,
-            transformation_file=gf_pipeline.transformation_file,
-            requirements=gf_pipeline.requirements,
-            sink_kind=gf_pipeline.sink_kind,
-            sink_config=gf_pipeline.sink_config,
-            source_kind=gf_pipeline.source_kind,
-            source_config=gf_pipeline.source_config,
-            env_vars=gf_pipeline.env_vars,
+            **{f: getattr(gf_pipeline, f) for f in fields},
             metadata={"view_only": True},
         )
-        log.info(f"Updated pipeline {gf_pipeline.id}")
+        log.info(f"Updated pipeline {gf_pipeline.id} ({', '.join(fields)})")
 
 
 def delete_pipelines(to_delete, client: GlassFlowClient) -> None:
@@ -118,67 +119,17 @@ def create_spaces(to_create, client: GlassFlowClient) -> dict[Path, str]:
     return new_spaces
 
 
-def get_pipelines_to_change(
-    files_deleted: list[Path],
-    files_changed: list[Path],
-    pipelines_dir: Path
-) -> dict:
-    """Returns a dictionary of changes that will be applied"""
-    pipeline_2_files = map_yaml_to_files(pipelines_dir)
-
-    pipelines_changed = set()
-    for file in files_changed:
-        if file.suffix in [".yaml", ".yml"]:
-            pipelines_changed.add(file)
-        elif file.suffix == ".py" or file.name == "requirements.txt":
-            for k in pipeline_2_files:
-                if file in pipeline_2_files[k]:
-                    pipelines_changed.add(k)
-        else:
-            continue
-
-    to_create = []
-    to_update = []
-    spaces_to_create = []
-    for file in pipelines_changed:
-        p = load_yaml_file(file)
-        if p.pipeline_id is not None:
-            to_update.append({"file": file, "pipeline": p})
-        else:
-            to_create.append({"file": file, "pipeline": p})
-
-        if p.space_id is None:
-            spaces_to_create.append({"file": file, "name": p.space_name})
-
-    to_delete = []
-    for file in files_deleted:
-        if file.suffix not in [".yaml", ".yml"]:
-            continue
-
-        try:
-            p = load_yaml_file(file)
-            to_delete.append({"file": file, "pipeline": p})
-        except Exception as e:
-            log.error(e)
-        finally:
-            file.unlink()
-
-    return {
-        "to_create": to_create,
-        "to_update": to_update,
-        "to_delete": to_delete,
-        "spaces_to_create": spaces_to_create,
-    }
-
-
 def push_to_cloud(
     files_changed: list[Path],
     files_deleted: list[Path],
     pipelines_dir: Path,
     client: GlassFlowClient,
     dry_run: bool = False,
+    base_ref: Optional[str] = None,
 ):
-    changes = get_pipelines_to_change(files_deleted, files_changed, pipelines_dir)
+    changes = get_pipelines_to_change(
+        files_deleted, files_changed, pipelines_dir, base_ref=base_ref
+    )
     generate_outputs(changes)
     if dry_run:
         log.info("This is a dry run. No changes will be applied.")
@@ -233,6 +184,13 @@ def main():
         type=Path,
         default="pipelines",
     )
+    parser.add_argument(
+        "--base-ref",
+        help="Git ref to compare pipeline YAML files with, to only update the "
+        "fields that changed. If empty, all the fields are updated.",
+        type=str,
+        default=None,
+    )
     parser.add_argument(
         "-t",
         "--personal-access-token",
@@ -246,10 +204,38 @@ def main():
         required=False,
         help="If set to True, no changes will be push to GlassFlow.",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        required=False,
+        help="If set to True, CPU and memory of the local phases are profiled "
+        "and no changes will be push to GlassFlow.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        help="Path to directory where the profiling artifacts are written.",
+        type=Path,
+        default="glassflow-profile",
+    )
     args = parser.parse_args()
 
     files_deleted = args.files_deleted if args.files_deleted else []
     files_changed = args.files_changed if args.files_changed else []
+    if args.profile:
+        changes = profile_local_phases(
+            files_changed=files_changed,
+            files_deleted=files_deleted,
+            pipelines_dir=args.pipelines_dir,
+            output_dir=args.profile_dir,
+            personal_access_token=args.personal_access_token,
+            base_ref=args.base_ref,
+        )
+        generate_outputs(changes)
+        set_outputs({"profile-dir": str(args.profile_dir.resolve())})
+        log.info("This is a profiling run. No changes will be applied.")
+        exit(0)
+
     client = GlassFlowClient(personal_access_token=args.personal_access_token)
     push_to_cloud(
         files_deleted=files_deleted,
@@ -257,6 +243,7 @@ def main():
         pipelines_dir=args.pipelines_dir,
         client=client,
         dry_run=args.dry_run,
+        base_ref=args.base_ref,
     )
 
 
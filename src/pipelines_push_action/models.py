@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class Pipeline(BaseModel):
@@ -20,9 +20,9 @@ class Pipeline(BaseModel):
     def check_space_filled(self):
         """Validate space is filled"""
         if self.space_id is None and self.space_name is None:
-            raise ValidationError("`space_id` or `space_name` must be filled")
+            raise ValueError("`space_id` or `space_name` must be filled")
         if self.pipeline_id is not None and self.space_id is None:
-            raise ValidationError("If `pipeline_id` is provided you must specify it's `space_id`")
+            raise ValueError("If `pipeline_id` is provided you must specify it's `space_id`")
         return self
 
     @model_validator(mode="after")
@@ -53,7 +53,7 @@ class EnvironmentVariable(BaseModel):
     @model_validator(mode="after")
     def check_filled(self):
         if self.value_secret_ref is None and self.value is None:
-            raise ValidationError("value or value_secret_ref must be filled")
+            raise ValueError("value or value_secret_ref must be filled")
         return self
 
 
@@ -64,7 +64,7 @@ class Requirements(BaseModel):
     @model_validator(mode="after")
     def check_filled(self):
         if self.path is None and self.value is None:
-            raise ValidationError("Path or value must be filled")
+            raise ValueError("Path or value must be filled")
         return self
 
 
@@ -75,7 +75,7 @@ class Transformation(BaseModel):
     @model_validator(mode="after")
     def check_filled(self):
         if self.path is None and self.value is None:
-            raise ValidationError("Path or value must be filled")
+            raise ValueError("Path or value must be filled")
         return self
 
 
@@ -106,7 +106,7 @@ class SourceComponent(BaseComponent):
             and self.config is None
             and self.config_secret_ref is None
         ):
-            raise ValidationError("config or config_secret_ref must be filled")
+            raise ValueError("config or config_secret_ref must be filled")
         return self
 
 
@@ -124,7 +124,7 @@ class SinkComponent(BaseComponent):
             and self.config is None
             and self.config_secret_ref is None
         ):
-            raise ValidationError("config or config_secret_ref must be filled")
+            raise ValueError("config or config_secret_ref must be filled")
         return self
 
 
@@ -0,0 +1,176 @@
+import cProfile
+import itertools
+import json
+import logging
+import pstats
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pipelines_push_action.changes import get_pipelines_to_change
+from pipelines_push_action.models import Pipeline
+from pipelines_push_action.yaml_utils import (
+    load_yaml_file,
+    map_yaml_to_files,
+    open_yaml,
+    yaml_file_to_pipeline,
+)
+
+log = logging.getLogger(__name__)
+
+PROFILE_SUMMARY_FILE = "profile.json"
+
+
+class Profiler:
+    """Records cProfile stats and tracemalloc allocations per phase"""
+
+    def __init__(self, output_dir: Path, top_allocations: int = 10):
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.phases = {}
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        setup: Optional[Callable[[], None]] = None,
+    ) -> Any:
+        """Profiles the CPU and memory usage of a phase.
+
+        The phase runs twice: once under cProfile and once under tracemalloc,
+        so that tracing allocations does not inflate the CPU timings.
+        Top allocation sites are the ones still alive at the end of the phase,
+        including its result, not the ones at the memory peak.
+
+        Args:
+            name (str): Name of the phase, used for the pstats file name
+                and as key in the JSON summary.
+            func (Callable): Phase to profile.
+            setup (Callable): Called before each run, outside the measurements,
+                to reset any state the phase changes.
+
+        Returns:
+            Any: What `func` returned on the cProfile run.
+        """
+        if setup is not None:
+            setup()
+        profile = cProfile.Profile(time.process_time)
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            result = func()
+        finally:
+            profile.disable()
+        wall_time = time.perf_counter() - start
+
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            # Keep the result alive so that its allocations are in the snapshot
+            result_mem = func()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            del result_mem
+        finally:
+            tracemalloc.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stats_file = self.output_dir / f"{name}.pstats"
+        profile.dump_stats(stats_file)
+        stats = pstats.Stats(profile)
+
+        self.phases[name] = {
+            # Wall time of the cProfile run, it includes the profiler overhead
+            "wall_time_s": wall_time,
+            "cpu_time_s": stats.total_tt,
+            "total_calls": stats.total_calls,
+            "memory_current_bytes": current,
+            "memory_peak_bytes": peak,
+            "top_allocations": [
+                {
+                    "site": str(s.traceback),
+                    "size_bytes": s.size,
+                    "count": s.count,
+                }
+                for s in snapshot.statistics("lineno")[:self.top_allocations]
+            ],
+            "pstats_file": str(stats_file),
+        }
+        return result
+
+    def write_summary(self) -> Path:
+        """Writes the JSON summary of all the recorded phases"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary_file = self.output_dir / PROFILE_SUMMARY_FILE
+        with open(summary_file, "w") as f:
+            json.dump(self.phases, f, indent=2)
+        return summary_file
+
+
+def profile_local_phases(
+    files_changed: list[Path],
+    files_deleted: list[Path],
+    pipelines_dir: Path,
+    output_dir: Path,
+    personal_access_token: str = None,
+    base_ref: Optional[str] = None,
+) -> dict:
+    """Profiles the local phases of a push without calling GlassFlow API
+
+    Each phase runs on its own so that the stats of one phase are not
+    mixed with the others. Artifacts (one pstats file per phase and a
+    `profile.json` summary) are written to `output_dir`.
+    """
+    profiler = Profiler(output_dir)
+    yml_files = list(
+        itertools.chain(pipelines_dir.rglob("*.yaml"), pipelines_dir.rglob("*.yml"))
+    )
+
+    profiler.run("map_yaml_to_files", lambda: map_yaml_to_files(pipelines_dir))
+    profiler.run(
+        "load_yaml_file", lambda: [load_yaml_file(file) for file in yml_files]
+    )
+
+    yaml_data = [open_yaml(file) for file in yml_files]
+    profiler.run(
+        "pipeline_validation", lambda: [Pipeline(**data) for data in yaml_data]
+    )
+
+    # Deleted files are removed by get_pipelines_to_change, restore them
+    # so that both runs see the same files
+    deleted_content = {f: f.read_bytes() for f in files_deleted if f.is_file()}
+
+    def restore_deleted_files():
+        for file, content in deleted_content.items():
+            file.write_bytes(content)
+
+    changes = profiler.run(
+        "get_pipelines_to_change",
+        lambda: get_pipelines_to_change(
+            files_deleted, files_changed, pipelines_dir, base_ref=base_ref
+        ),
+        setup=restore_deleted_files,
+    )
+
+    # GlassFlow SDK Pipeline objects are only built, never pushed. Inline
+    # transformations are written to a temporary directory, not the pipelines dir
+    with tempfile.TemporaryDirectory() as transformation_dir:
+        profiler.run(
+            "yaml_file_to_pipeline",
+            lambda: [
+                yaml_file_to_pipeline(
+                    pipeline_file=change["file"],
+                    pipeline=change["pipeline"],
+                    personal_access_token=personal_access_token,
+                    transformation_dir=Path(transformation_dir),
+                )
+                for change in changes["to_create"] + changes["to_update"]
+            ],
+        )
+
+    summary_file = profiler.write_summary()
+    log.info(f"Profile written to {summary_file}")
+    return changes
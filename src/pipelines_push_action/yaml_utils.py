@@ -1,13 +1,26 @@
 import itertools
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import ruamel.yaml
 from glassflow import Pipeline as GlassFlowPipeline
+from pydantic import ValidationError
 
 from pipelines_push_action.errors import YAMLFileEmptyError
+from pipelines_push_action.github_utils import get_file_at_ref
 from pipelines_push_action.models import Pipeline
 
+PIPELINE_UPDATE_FIELDS = (
+    "name",
+    "transformation_file",
+    "requirements",
+    "sink_kind",
+    "sink_config",
+    "source_kind",
+    "source_config",
+    "env_vars",
+)
+
 
 def load_yaml_file(file):
     """Loads Pipeline YAML file"""
@@ -16,6 +29,25 @@ def load_yaml_file(file):
     return Pipeline(**yaml_data)
 
 
+def load_yaml_file_at_ref(file: Path, ref: str) -> Optional[Pipeline]:
+    """Loads Pipeline YAML file as it was at a given git ref
+
+    Returns None if the file did not exist at that ref or is not a valid pipeline.
+    """
+    content = get_file_at_ref(file, ref)
+    if not content:
+        return None
+
+    try:
+        ryaml = ruamel.yaml.YAML(typ="rt")
+        yaml_data = ryaml.load(content)
+        if not isinstance(yaml_data, dict):
+            return None
+        return Pipeline(**yaml_data)
+    except (ruamel.yaml.YAMLError, ValidationError):
+        return None
+
+
 def open_yaml(path: Path) -> dict[str, Any]:
     """Opens a yaml file... Nothing too exciting there.
 
@@ -76,10 +108,16 @@ def map_yaml_to_files(path: Path) -> dict[Path, list[Path]]:
 
 
 def yaml_file_to_pipeline(
-    pipeline_file: Path, pipeline: Pipeline, personal_access_token: str
+    pipeline_file: Path,
+    pipeline: Pipeline,
+    personal_access_token: str,
+    transformation_dir: Optional[Path] = None,
 ) -> GlassFlowPipeline:
     """
     Converts a Pipeline YAML file into GlassFlow SDK Pipeline
+
+    Inline transformations are written to `handler.py` in `transformation_dir`,
+    which defaults to the directory of the YAML file.
     """
     yaml_file_dir = pipeline_file.parent
 
@@ -100,7 +138,9 @@ def yaml_file_to_pipeline(
     if transformer.transformation.path is not None:
         transform = str(yaml_file_dir / transformer.transformation.path)
     else:
-        transform = str(yaml_file_dir / "handler.py")
+        if transformation_dir is None:
+            transformation_dir = yaml_file_dir
+        transform = str(transformation_dir / "handler.py")
         with open(transform, "w") as f:
             f.write(transformer.transformation.value)
 
@@ -130,6 +170,65 @@ def yaml_file_to_pipeline(
     )
 
 
+def get_pipeline_changed_fields(old: Optional[Pipeline], new: Pipeline) -> set[str]:
+    """
+    Returns the GlassFlow SDK Pipeline fields that differ between two
+    versions of a Pipeline YAML. All fields are returned if there is
+    no old version to compare with, or if it did not describe the same
+    pipeline (`pipeline_id` added or changed).
+    """
+    if old is None or old.pipeline_id != new.pipeline_id:
+        return set(PIPELINE_UPDATE_FIELDS)
+
+    old_components = {c.type: c for c in old.components}
+    new_components = {c.type: c for c in new.components}
+
+    fields = set()
+    if old.name != new.name:
+        fields.add("name")
+
+    old_transformer = old_components["transformer"]
+    new_transformer = new_components["transformer"]
+    if old_transformer.transformation != new_transformer.transformation:
+        fields.add("transformation_file")
+    if old_transformer.requirements != new_transformer.requirements:
+        fields.add("requirements")
+    if old_transformer.env_vars != new_transformer.env_vars:
+        fields.add("env_vars")
+
+    # Kind and config are sent together, the API validates one against the other
+    for component_type in ["source", "sink"]:
+        old_component = old_components[component_type]
+        new_component = new_components[component_type]
+        if (
+            old_component.kind != new_component.kind or
+            old_component.config != new_component.config or
+            old_component.config_secret_ref != new_component.config_secret_ref
+        ):
+            fields.add(f"{component_type}_kind")
+            fields.add(f"{component_type}_config")
+    return fields
+
+
+def get_pipeline_unset_fields(pipeline: Pipeline) -> set[str]:
+    """
+    Returns the GlassFlow SDK Pipeline fields that are not set in a Pipeline
+    YAML. GlassFlow SDK reads them as `None`, which keeps the current value.
+    """
+    components = {c.type: c for c in pipeline.components}
+
+    fields = set()
+    if components["transformer"].requirements is None:
+        fields.add("requirements")
+    if components["transformer"].env_vars is None:
+        fields.add("env_vars")
+    for component_type in ["source", "sink"]:
+        if components[component_type].kind is None:
+            fields.add(f"{component_type}_kind")
+            fields.add(f"{component_type}_config")
+    return fields
+
+
 def pipeline_to_yaml(pipeline: Pipeline, input_yaml: Path, output_yaml: Path = None) -> None:
     yaml_data = open_yaml(input_yaml)
 
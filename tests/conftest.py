@@ -1,7 +1,11 @@
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
 
+from pipelines_push_action.yaml_utils import update_pipeline_id_in_yaml
+
 
 @pytest.fixture
 def yaml_file():
@@ -11,3 +15,34 @@ def yaml_file():
 @pytest.fixture
 def pipeline_yaml(yaml_file):
     return
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def pipelines_repo(yaml_file, tmp_path):
+    """Git repository with one committed pipeline, returns its pipelines dir"""
+    pipelines_dir = tmp_path / "pipelines"
+    shutil.copytree(
+        yaml_file.parent, pipelines_dir, ignore=shutil.ignore_patterns("__pycache__")
+    )
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return pipelines_dir
+
+
+@pytest.fixture
+def pipeline_file(pipelines_repo):
+    """Committed pipeline YAML with a pipeline_id"""
+    file = pipelines_repo / "pipeline.yaml"
+    update_pipeline_id_in_yaml("test-pipeline-id", file)
+    git(pipelines_repo, "commit", "-q", "-am", "add pipeline id")
+    return file
@@ -0,0 +1,70 @@
+from pipelines_push_action import yaml_utils
+from pipelines_push_action.changes import get_pipelines_to_change
+
+# Source and sink of the test pipeline have no kind
+ALL_FIELDS = set(yaml_utils.PIPELINE_UPDATE_FIELDS) - {
+    "source_kind", "source_config", "sink_kind", "sink_config"
+}
+
+
+def test_get_pipelines_to_change_handler(pipeline_file):
+    changes = get_pipelines_to_change(
+        [], [pipeline_file.parent / "handler.py"], pipeline_file.parent
+    )
+    assert changes["to_update"][0]["fields"] == {"transformation_file"}
+
+
+def test_get_pipelines_to_change_requirements(pipeline_file):
+    changes = get_pipelines_to_change(
+        [], [pipeline_file.parent / "requirements.txt"], pipeline_file.parent
+    )
+    assert changes["to_update"][0]["fields"] == {"requirements"}
+
+
+def test_get_pipelines_to_change_yaml_without_base_ref(pipeline_file):
+    changes = get_pipelines_to_change([], [pipeline_file], pipeline_file.parent)
+    assert changes["to_update"][0]["fields"] == ALL_FIELDS
+
+
+def test_get_pipelines_to_change_yaml_with_base_ref(pipeline_file):
+    yaml_data = yaml_utils.open_yaml(pipeline_file)
+    yaml_data["components"][1]["env_vars"][0]["value"] = "new-value"
+    yaml_utils.save_yaml(pipeline_file, yaml_data)
+
+    changes = get_pipelines_to_change(
+        [],
+        [pipeline_file, pipeline_file.parent / "handler.py"],
+        pipeline_file.parent,
+        base_ref="HEAD",
+    )
+    assert changes["to_update"][0]["fields"] == {"env_vars", "transformation_file"}
+
+
+def test_get_pipelines_to_change_new_pipeline_id(pipeline_file):
+    # Base ref is the version before the pipeline_id was set
+    changes = get_pipelines_to_change(
+        [], [pipeline_file], pipeline_file.parent, base_ref="HEAD~1"
+    )
+    assert changes["to_update"][0]["fields"] == ALL_FIELDS
+
+
+def test_get_pipelines_to_change_removed_field(pipeline_file, caplog):
+    yaml_data = yaml_utils.open_yaml(pipeline_file)
+    yaml_data["name"] = "New name"
+    del yaml_data["components"][1]["env_vars"]
+    yaml_utils.save_yaml(pipeline_file, yaml_data)
+
+    changes = get_pipelines_to_change(
+        [], [pipeline_file], pipeline_file.parent, base_ref="HEAD"
+    )
+    assert changes["to_update"][0]["fields"] == {"name"}
+    assert "Fields env_vars were removed from pipeline test-pipeline-id" in caplog.text
+
+
+def test_get_pipelines_to_change_other_pipeline_id(pipeline_file):
+    yaml_utils.update_pipeline_id_in_yaml("other-pipeline-id", pipeline_file)
+
+    changes = get_pipelines_to_change(
+        [], [pipeline_file], pipeline_file.parent, base_ref="HEAD"
+    )
+    assert changes["to_update"][0]["fields"] == ALL_FIELDS
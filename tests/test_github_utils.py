@@ -0,0 +1,27 @@
+from pipelines_push_action import github_utils
+
+
+def test_get_file_at_ref(pipelines_repo, monkeypatch):
+    pipeline_file = pipelines_repo / "pipeline.yaml"
+    content = pipeline_file.read_text()
+    pipeline_file.write_text("name: changed\n")
+
+    # Absolute path
+    assert github_utils.get_file_at_ref(pipeline_file, "HEAD") == content
+
+    # Path relative to the working directory
+    monkeypatch.chdir(pipelines_repo.parent)
+    relative_file = pipeline_file.relative_to(pipelines_repo.parent)
+    assert github_utils.get_file_at_ref(relative_file, "HEAD") == content
+
+
+def test_get_file_at_ref_not_found(pipelines_repo):
+    assert github_utils.get_file_at_ref(pipelines_repo / "new.yaml", "HEAD") is None
+    assert github_utils.get_file_at_ref(
+        pipelines_repo / "pipeline.yaml", "unknown-ref"
+    ) is None
+
+
+def test_get_file_at_ref_without_git(pipelines_repo, monkeypatch):
+    monkeypatch.setenv("PATH", "")
+    assert github_utils.get_file_at_ref(pipelines_repo / "pipeline.yaml", "HEAD") is None
@@ -0,0 +1,46 @@
+import logging
+from types import SimpleNamespace
+from unittest import mock
+
+from pipelines_push_action import main, yaml_utils
+from pipelines_push_action.changes import get_pipelines_to_change
+
+
+def test_generate_outputs(pipeline_file, tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("GITHUB_OUTPUT", str(tmp_path / "github_output"))
+    changes = get_pipelines_to_change(
+        [], [pipeline_file.parent / "requirements.txt"], pipeline_file.parent
+    )
+
+    with caplog.at_level(logging.INFO):
+        main.generate_outputs(changes)
+    assert "test-pipeline-id: requirements" in caplog.text
+
+
+def test_update_pipelines(pipeline_file, monkeypatch):
+    gf_pipeline = SimpleNamespace(
+        id="test-pipeline-id",
+        name="Pipeline",
+        transformation_file="handler.py",
+        requirements="requests",
+        sink_kind=None,
+        sink_config=None,
+        source_kind=None,
+        source_config=None,
+        env_vars=[{"name": "AES_KEY", "value": "new-value"}],
+    )
+    monkeypatch.setattr(main, "yaml_file_to_pipeline", lambda **kwargs: gf_pipeline)
+    client = mock.Mock()
+
+    to_update = [{
+        "file": pipeline_file,
+        "pipeline": yaml_utils.load_yaml_file(pipeline_file),
+        "fields": {"env_vars"},
+    }]
+    main.update_pipelines(to_update, client)
+
+    client.get_pipeline.assert_called_once_with("test-pipeline-id")
+    client.get_pipeline.return_value.update.assert_called_once_with(
+        env_vars=[{"name": "AES_KEY", "value": "new-value"}],
+        metadata={"view_only": True},
+    )
@@ -0,0 +1,75 @@
+import json
+from unittest import mock
+
+import glassflow
+
+from pipelines_push_action import profiling, yaml_utils
+
+PHASES = [
+    "map_yaml_to_files",
+    "load_yaml_file",
+    "pipeline_validation",
+    "get_pipelines_to_change",
+    "yaml_file_to_pipeline",
+]
+
+
+def test_profiler_run(yaml_file, tmp_path):
+    profiler = profiling.Profiler(tmp_path)
+    pipeline = profiler.run(
+        "load_yaml_file", lambda: yaml_utils.load_yaml_file(yaml_file)
+    )
+
+    summary_file = profiler.write_summary()
+    summary = json.loads(summary_file.read_text())
+
+    assert pipeline.space_id == "my-space-id"
+    assert (tmp_path / "load_yaml_file.pstats").is_file()
+    assert summary["load_yaml_file"]["total_calls"] > 0
+    assert summary["load_yaml_file"]["memory_peak_bytes"] > 0
+    assert len(summary["load_yaml_file"]["top_allocations"]) > 0
+
+
+def test_profile_local_phases(yaml_file, tmp_path, monkeypatch):
+    sdk_calls = {}
+    for method in ["create", "update", "fetch", "delete", "_request"]:
+        sdk_calls[method] = mock.Mock()
+        monkeypatch.setattr(glassflow.Pipeline, method, sdk_calls[method])
+
+    changes = profiling.profile_local_phases(
+        files_changed=[yaml_file],
+        files_deleted=[],
+        pipelines_dir=yaml_file.parent,
+        output_dir=tmp_path,
+        personal_access_token="test-token",
+    )
+
+    summary = json.loads((tmp_path / profiling.PROFILE_SUMMARY_FILE).read_text())
+    assert list(summary) == PHASES
+    for phase in PHASES:
+        assert (tmp_path / f"{phase}.pstats").is_file()
+    assert len(changes["to_create"]) == 1
+    for sdk_call in sdk_calls.values():
+        sdk_call.assert_not_called()
+
+
+def test_profile_local_phases_inline_transformation(yaml_file, tmp_path):
+    pipelines_dir = tmp_path / "pipelines"
+    pipelines_dir.mkdir()
+    pipeline_file = pipelines_dir / "pipeline.yaml"
+    yaml_data = yaml_utils.open_yaml(yaml_file)
+    yaml_data["components"][1]["transformation"] = {
+        "value": "def handler(data, log):\n    return data\n"
+    }
+    yaml_data["components"][1]["requirements"] = {"value": "requests"}
+    yaml_utils.save_yaml(pipeline_file, yaml_data)
+
+    profiling.profile_local_phases(
+        files_changed=[pipeline_file],
+        files_deleted=[],
+        pipelines_dir=pipelines_dir,
+        output_dir=tmp_path / "profile",
+        personal_access_token="test-token",
+    )
+
+    assert list(pipelines_dir.iterdir()) == [pipeline_file]
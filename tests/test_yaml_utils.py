@@ -3,6 +3,7 @@ from pathlib import Path
 import filecmp
 
 from pipelines_push_action import yaml_utils
+from tests.conftest import git
 
 
 
@@ -61,4 +62,70 @@ def test_map_yaml_to_files(yaml_file):
             Path("tests/data/requirements.txt"),
             Path("tests/data/handler.py"),
         ]
-    }
\ No newline at end of file
+    }
+
+
+def test_get_pipeline_changed_fields(yaml_file):
+    old = yaml_utils.load_yaml_file(yaml_file)
+    new = old.model_copy(deep=True)
+    assert yaml_utils.get_pipeline_changed_fields(old, new) == set()
+
+    transformer = [c for c in new.components if c.type == "transformer"][0]
+    transformer.env_vars[0].value = "new-value"
+    assert yaml_utils.get_pipeline_changed_fields(old, new) == {"env_vars"}
+
+    sink = [c for c in new.components if c.type == "sink"][0]
+    sink.kind = "webhook"
+    sink.config = {"url": "https://example.com"}
+    assert yaml_utils.get_pipeline_changed_fields(old, new) == {
+        "env_vars", "sink_kind", "sink_config"
+    }
+
+
+def test_get_pipeline_changed_fields_without_old(yaml_file):
+    new = yaml_utils.load_yaml_file(yaml_file)
+    fields = yaml_utils.get_pipeline_changed_fields(None, new)
+    assert fields == set(yaml_utils.PIPELINE_UPDATE_FIELDS)
+
+
+def test_get_pipeline_changed_fields_new_pipeline_id(yaml_file):
+    old = yaml_utils.load_yaml_file(yaml_file)
+    new = old.model_copy(update={"pipeline_id": "existing-pipeline-id"})
+    fields = yaml_utils.get_pipeline_changed_fields(old, new)
+    assert fields == set(yaml_utils.PIPELINE_UPDATE_FIELDS)
+
+
+def test_get_pipeline_changed_fields_other_pipeline_id(yaml_file):
+    old = yaml_utils.load_yaml_file(yaml_file).model_copy(
+        update={"pipeline_id": "old-pipeline-id"}
+    )
+    new = old.model_copy(update={"pipeline_id": "other-pipeline-id"})
+    fields = yaml_utils.get_pipeline_changed_fields(old, new)
+    assert fields == set(yaml_utils.PIPELINE_UPDATE_FIELDS)
+
+
+def test_load_yaml_file_at_ref(pipelines_repo):
+    pipeline_file = pipelines_repo / "pipeline.yaml"
+    yaml_utils.update_pipeline_id_in_yaml("test-pipeline-id", pipeline_file)
+
+    old = yaml_utils.load_yaml_file_at_ref(pipeline_file, "HEAD")
+    assert old.pipeline_id is None
+    assert yaml_utils.load_yaml_file_at_ref(pipeline_file, "unknown-ref") is None
+
+
+def test_load_yaml_file_at_ref_invalid(pipelines_repo):
+    pipeline_file = pipelines_repo / "pipeline.yaml"
+    pipeline_file.write_text("name: [unclosed")
+    git(pipelines_repo, "commit", "-q", "-am", "malformed yaml")
+    assert yaml_utils.load_yaml_file_at_ref(pipeline_file, "HEAD") is None
+
+    pipeline_file.write_text("name: Missing components\n")
+    git(pipelines_repo, "commit", "-q", "-am", "invalid pipeline")
+    assert yaml_utils.load_yaml_file_at_ref(pipeline_file, "HEAD") is None
+
+
+def test_get_pipeline_unset_fields(yaml_file):
+    pipeline = yaml_utils.load_yaml_file(yaml_file)
+    assert yaml_utils.get_pipeline_unset_fields(pipeline) == {
+        "source_kind", "source_config", "sink_kind", "sink_config"
+    }